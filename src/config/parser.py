@@ -19,6 +19,7 @@ from .schema import (
 
 _ALLOWED_UI_VARIANTS = {"jarvis", "miro"}
 _ALLOWED_LLM_AFFINITY_MODES = {"pinned", "shared"}
+_CUDA_STT_COMPUTE_TYPE = "int8_float16"
 
 
 def parse_app_config(
@@ -119,11 +120,17 @@ def _parse_wake_word_settings(
 
 
 def _parse_stt_settings(section: Mapping[str, Any]) -> STTSettings:
+    device = _as_str(section.get("device", STTSettings.device), "stt.device")
+    # int8 weights with float16 activations is the CUDA counterpart of the
+    # CPU int8 default; an explicit compute_type always wins.
+    default_compute_type = (
+        _CUDA_STT_COMPUTE_TYPE if device.lower() == "cuda" else STTSettings.compute_type
+    )
     return STTSettings(
         model_size=_as_str(section.get("model_size", STTSettings.model_size), "stt.model_size"),
-        device=_as_str(section.get("device", STTSettings.device), "stt.device"),
+        device=device,
         compute_type=_as_str(
-            section.get("compute_type", STTSettings.compute_type),
+            section.get("compute_type", default_compute_type),
             "stt.compute_type",
         ),
         language=(
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Self
 
 from .model_store import HFModelSpec, ModelDownloadError, ensure_model_downloaded
 
+# Matches GGUF files that ship full-precision weights, e.g. "model-f16.gguf".
+_UNQUANTIZED_GGUF_RE = re.compile(r"[.\-_](?:f16|fp16|bf16|f32|fp32)\.gguf$", re.IGNORECASE)
+
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid."""
@@ -214,6 +218,11 @@ class LLMConfig:
             raise ConfigurationError(
                 f"hf_filename must be a .gguf file, got: {filename}"
             )
+        if _UNQUANTIZED_GGUF_RE.search(filename):
+            logger.warning(
+                f"Model {filename} holds unquantized weights; a Q4_K_M GGUF "
+                f"decodes several times faster on CPU"
+            )
 
         model_dir_path = Path(model_dir_str)
 
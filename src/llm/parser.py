@@ -43,6 +43,10 @@ from .parser_rules import (
 )
 from .types import StructuredResponse, ToolCall, ToolName
 
+# Maps decoded names onto the contract's own string objects so downstream
+# dispatch compares and hashes the interned constants.
+_CANONICAL_TOOL_NAMES: dict[str, str] = {name: name for name in TOOL_NAMES}
+
 
 class ResponseParser:
     """Normalize model output and apply intent fallbacks.
@@ -148,16 +152,14 @@ class ResponseParser:
         return self._tool_call(normalized_name, normalized_arguments)
 
     def _resolve_tool_name(self, raw_name: str) -> str | None:
-        normalized_name = raw_name.strip()
-        if normalized_name in TOOL_NAMES:
-            return normalized_name
-        return None
+        return _CANONICAL_TOOL_NAMES.get(raw_name.strip())
 
     def _normalize_arguments_for_tool(
         self, tool_name: str, arguments: dict[str, Any], user_prompt: str
     ) -> dict[str, Any] | None:
+        get = arguments.get
         if tool_name == TOOL_START_TIMER:
-            duration = normalize_duration(arguments.get("duration"))
+            duration = normalize_duration(get("duration"))
             if duration is None:
                 duration = extract_duration_from_prompt(user_prompt) or str(
                     DEFAULT_TIMER_MINUTES
@@ -169,7 +171,7 @@ class ResponseParser:
 
         if tool_name == TOOL_START_POMODORO:
             raw_topic = (
-                arguments.get("focus_topic")
+                get("focus_topic")
                 or extract_focus_topic(user_prompt)
                 or self._last_focus_topic
                 or DEFAULT_FOCUS_TOPIC_DE
@@ -180,7 +182,7 @@ class ResponseParser:
 
         if tool_name == TOOL_SHOW_UPCOMING_EVENTS:
             time_range = sanitize_time_range(
-                arguments.get("time_range")
+                get("time_range")
                 or extract_time_range(user_prompt)
                 or self._last_time_range
                 or DEFAULT_CALENDAR_TIME_RANGE
@@ -192,18 +194,18 @@ class ResponseParser:
             now_local = datetime.now().astimezone()
             now_fn = lambda: now_local
             title = sanitize_text(
-                arguments.get("title") or extract_calendar_title(user_prompt),
+                get("title") or extract_calendar_title(user_prompt),
                 max_len=120,
             )
             start_time = normalize_calendar_datetime_input(
-                arguments.get("start_time"),
+                get("start_time"),
                 now_fn=now_fn,
             ) or self._extract_datetime_literal(user_prompt, now_fn=now_fn)
             end_time = normalize_calendar_datetime_input(
-                arguments.get("end_time"),
+                get("end_time"),
                 now_fn=now_fn,
             )
-            duration = normalize_duration(arguments.get("duration"))
+            duration = normalize_duration(get("duration"))
 
             if not title or not start_time:
                 return None
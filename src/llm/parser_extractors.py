@@ -3,26 +3,96 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import re
 from typing import Any, Callable
 
 from shared.defaults import DEFAULT_CALENDAR_TIME_RANGE
+from shared.time_parsing import DAY_OFFSETS, DURATION_UNIT_MAP
+
+_UMLAUT_TABLE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue"})
+
+_QUOTE_CHARS = "\"'“”„"
+
+_DE_DATETIME_RE = re.compile(
+    r"(\d{1,2})\.(\d{1,2})\.(\d{4})\s*(?:um|,)?\s*(\d{1,2})(?:[:.](\d{2}))?\s*(?:uhr)?",
+    re.I,
+)
+_RELATIVE_DATETIME_RE = re.compile(
+    r"(heute|morgen|uebermorgen|übermorgen)\s*(?:um\s*)?(\d{1,2})(?:[:.](\d{2}))?\s*(?:uhr)?",
+    re.I,
+)
+_DURATION_PLAIN_RE = re.compile(r"\d{1,4}")
+_DURATION_UNIT_RE = re.compile(
+    r"(\d{1,4})\s*(sek|sekunde|sekunden|s|min|minute|minuten|m|stunde|stunden|h)",
+    re.IGNORECASE,
+)
+_FOCUS_RE = re.compile(
+    r"\b(?:fuer|für|zu|zum|am)\s+([a-zA-Z0-9äöüÄÖÜß][\wäöüÄÖÜß\-\s]{1,60})",
+    re.I,
+)
+_TOPIC_SPLIT_RE = re.compile(r"\b(?:in|um|ab|morgen|heute)\b", re.I)
+_DAYS_RANGE_RE = re.compile(r"(naechste|nächste)\s+(\d+)\s+tage")
+_TITLE_KW_RE = re.compile(
+    r"\b(?:titel|title)\s+([a-zA-Z0-9äöüÄÖÜß][\wäöüÄÖÜß\-\s]{2,120})",
+    re.I,
+)
+_TITLE_EVENT_RE = re.compile(
+    r"\b(?:termin|event)\s+(?:mit\s+dem\s+titel\s+)?([a-zA-Z0-9äöüÄÖÜß][\wäöüÄÖÜß\-\s]{2,120})",
+    re.I,
+)
+_TITLE_SPLIT_RE = re.compile(
+    r"\b(?:am|um|ab|von|fuer|für|dauer|start|ende|hinzu)\b",
+    re.I,
+)
+_ISO_LITERAL_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2}[T\s]\d{1,2}:\d{2}(?::\d{2})?)\b")
+_DE_LITERAL_RE = re.compile(
+    r"\b(\d{1,2})\.(\d{1,2})\.(\d{4})\s*(?:um|,)?\s*(\d{1,2})[:.](\d{2})\b",
+    re.I,
+)
+_REL_LITERAL_RE = re.compile(
+    r"\b(heute|morgen|uebermorgen|übermorgen)\s*(?:um\s*)?(\d{1,2})(?:[:.](\d{2}))?\s*uhr?\b",
+    re.I,
+)
 
 
 def sanitize_text(value: Any, *, max_len: int) -> str:
     """Normalize arbitrary text by trimming whitespace and enforcing a length limit."""
     if value is None:
         return ""
-    text = str(value).strip()
-    text = re.sub(r"\s+", " ", text)
+    text = " ".join(str(value).split())
     return text[:max_len].strip()
 
 
+def _next_quote(text: str, start: int) -> int:
+    positions = [
+        index
+        for index in (text.find(quote, start) for quote in _QUOTE_CHARS)
+        if index != -1
+    ]
+    return min(positions) if positions else -1
+
+
+def _find_quoted(text: str) -> str | None:
+    """Return the first non-empty single-line span enclosed in quote characters."""
+    start = _next_quote(text, 0)
+    while start != -1:
+        end = _next_quote(text, start + 2)
+        if end == -1:
+            return None
+        newline = text.find("\n", start + 1, end)
+        if newline == -1:
+            return text[start + 1 : end]
+        start = _next_quote(text, start + 1)
+    return None
+
+
 def _resolve_reference_now(now_fn: Callable[[], datetime] | None) -> datetime:
-    reference = now_fn() if now_fn is not None else datetime.now().astimezone()
+    if now_fn is None:
+        return datetime.now().astimezone()
+    reference = now_fn()
     if reference.tzinfo is None:
-        local_tz = datetime.now().astimezone().tzinfo or timezone.utc
-        return reference.replace(tzinfo=local_tz)
+        return reference.astimezone()
     return reference
 
 
@@ -37,6 +107,56 @@ def _ensure_timezone(
     return value.replace(tzinfo=reference.tzinfo or timezone.utc)
 
 
+def _iso_datetime(raw: str, *, now_fn: Callable[[], datetime] | None) -> str | None:
+    iso_candidate = raw.replace(" ", "T")
+    if iso_candidate.endswith("Z"):
+        iso_candidate = iso_candidate[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(iso_candidate)
+    except ValueError:
+        return None
+    parsed = _ensure_timezone(parsed, now_fn=now_fn)
+    return parsed.isoformat(timespec="minutes")
+
+
+def _absolute_datetime(
+    *,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    now_fn: Callable[[], datetime] | None,
+) -> str | None:
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        return None
+    try:
+        parsed = datetime(year=year, month=month, day=day, hour=hour, minute=minute)
+    except ValueError:
+        return None
+    parsed = _ensure_timezone(parsed, now_fn=now_fn)
+    return parsed.isoformat(timespec="minutes")
+
+
+def _relative_datetime(
+    day_token: str,
+    *,
+    hour: int,
+    minute: int,
+    now_fn: Callable[[], datetime] | None,
+) -> str | None:
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        return None
+    base = _resolve_reference_now(now_fn)
+    target = (base + timedelta(days=DAY_OFFSETS[day_token.lower()])).replace(
+        hour=hour,
+        minute=minute,
+        second=0,
+        microsecond=0,
+    )
+    return target.isoformat(timespec="minutes")
+
+
 def normalize_calendar_datetime_input(
     value: Any,
     *,
@@ -48,61 +168,31 @@ def normalize_calendar_datetime_input(
     if not raw:
         return None
 
-    iso_candidate = raw.replace(" ", "T")
-    if iso_candidate.endswith("Z"):
-        iso_candidate = iso_candidate[:-1] + "+00:00"
-    try:
-        parsed = datetime.fromisoformat(iso_candidate)
-        parsed = _ensure_timezone(parsed, now_fn=now_fn)
-        return parsed.isoformat(timespec="minutes")
-    except ValueError:
-        pass
+    iso_value = _iso_datetime(raw, now_fn=now_fn)
+    if iso_value is not None:
+        return iso_value
 
-    de_match = re.fullmatch(
-        r"(\d{1,2})\.(\d{1,2})\.(\d{4})\s*(?:um|,)?\s*(\d{1,2})(?:[:.](\d{2}))?\s*(?:uhr)?",
-        raw,
-        re.I,
-    )
+    de_match = _DE_DATETIME_RE.fullmatch(raw)
     if de_match:
         day, month, year, hour_raw, minute_raw = de_match.groups()
-        hour = int(hour_raw)
-        minute = int(minute_raw or "0")
-        if not (0 <= hour <= 23 and 0 <= minute <= 59):
-            return None
-        try:
-            parsed = datetime(
-                year=int(year),
-                month=int(month),
-                day=int(day),
-                hour=hour,
-                minute=minute,
-            )
-        except ValueError:
-            return None
-        parsed = _ensure_timezone(parsed, now_fn=now_fn)
-        return parsed.isoformat(timespec="minutes")
+        return _absolute_datetime(
+            year=int(year),
+            month=int(month),
+            day=int(day),
+            hour=int(hour_raw),
+            minute=int(minute_raw or "0"),
+            now_fn=now_fn,
+        )
 
-    relative_match = re.fullmatch(
-        r"(heute|morgen|uebermorgen|übermorgen)\s*(?:um\s*)?(\d{1,2})(?:[:.](\d{2}))?\s*(?:uhr)?",
-        raw,
-        re.I,
-    )
+    relative_match = _RELATIVE_DATETIME_RE.fullmatch(raw)
     if relative_match:
         day_token, hour_raw, minute_raw = relative_match.groups()
-        hour = int(hour_raw)
-        minute = int(minute_raw or "0")
-        if not (0 <= hour <= 23 and 0 <= minute <= 59):
-            return None
-        day_key = day_token.lower()
-        offset_days = {"heute": 0, "morgen": 1, "uebermorgen": 2, "übermorgen": 2}
-        base = _resolve_reference_now(now_fn)
-        target = (base + timedelta(days=offset_days[day_key])).replace(
-            hour=hour,
-            minute=minute,
-            second=0,
-            microsecond=0,
+        return _relative_datetime(
+            day_token,
+            hour=int(hour_raw),
+            minute=int(minute_raw or "0"),
+            now_fn=now_fn,
         )
-        return target.isoformat(timespec="minutes")
 
     return None
 
@@ -116,32 +206,28 @@ def normalize_duration(value: Any) -> str | None:
         return str(minutes) if minutes > 0 else None
     if not isinstance(value, str):
         return None
+    return _normalize_duration_text(value)
 
+
+@lru_cache(maxsize=256)
+def _normalize_duration_text(value: str) -> str | None:
     raw = value.strip().lower()
     if not raw:
         return None
 
-    plain = re.fullmatch(r"\d{1,4}", raw)
+    plain = _DURATION_PLAIN_RE.fullmatch(raw)
     if plain:
         return plain.group(0)
 
-    match = re.search(
-        r"(\d{1,4})\s*(sek|sekunde|sekunden|s|min|minute|minuten|m|stunde|stunden|h)",
-        raw,
-        re.IGNORECASE,
-    )
+    match = _DURATION_UNIT_RE.search(raw)
     if not match:
         return None
 
     amount = int(match.group(1))
-    unit = match.group(2)
     if amount <= 0:
         return None
-    if unit in {"sek", "sekunde", "sekunden", "s"}:
-        return f"{amount}s"
-    if unit in {"stunde", "stunden", "h"}:
-        return f"{amount}h"
-    return f"{amount}m"
+    suffix = DURATION_UNIT_MAP.get(match.group(2), "m")
+    return f"{amount}{suffix}"
 
 
 def extract_duration_from_prompt(prompt: str) -> str | None:
@@ -151,20 +237,16 @@ def extract_duration_from_prompt(prompt: str) -> str | None:
 
 def extract_focus_topic(prompt: str) -> str | None:
     """Extract a likely pomodoro focus topic from prompt text."""
-    quoted = re.search(r"[\"'“”„](.+?)[\"'“”„]", prompt)
-    if quoted:
-        return quoted.group(1)
-
-    match = re.search(
-        r"\b(?:fuer|für|zu|zum|am)\s+([a-zA-Z0-9äöüÄÖÜß][\wäöüÄÖÜß\-\s]{1,60})",
-        prompt,
-        re.I,
-    )
+    quoted = _find_quoted(prompt)
+    if quoted is not None:
+        return quoted
+
+    match = _FOCUS_RE.search(prompt)
     if not match:
         return None
 
     topic = match.group(1)
-    topic = re.split(r"\b(?:in|um|ab|morgen|heute)\b", topic, flags=re.I)[0]
+    topic = _TOPIC_SPLIT_RE.split(topic)[0]
     return topic.strip() or None
 
 
@@ -173,22 +255,20 @@ def sanitize_time_range(value: Any) -> str:
     text = sanitize_text(value, max_len=64).lower()
     if not text:
         return DEFAULT_CALENDAR_TIME_RANGE
-    return text.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue")
+    return text.translate(_UMLAUT_TABLE)
 
 
+@lru_cache(maxsize=256)
 def extract_time_range(prompt: str) -> str | None:
     """Extract relative calendar windows such as today or next week."""
     lowered = prompt.lower()
-    if "uebermorgen" in lowered or "übermorgen" in lowered:
-        return "uebermorgen"
     if "morgen" in lowered:
+        if "uebermorgen" in lowered or "übermorgen" in lowered:
+            return "uebermorgen"
         return "morgen"
     if "naechste woche" in lowered or "nächste woche" in lowered:
         return "naechste woche"
-    days_match = re.search(
-        r"(naechste|nächste)\s+(\d+)\s+tage",
-        lowered,
-    )
+    days_match = _DAYS_RANGE_RE.search(lowered)
     if days_match:
         return f"naechste {days_match.group(2)} tage"
     if "heute" in lowered:
@@ -198,35 +278,19 @@ def extract_time_range(prompt: str) -> str | None:
 
 def extract_calendar_title(prompt: str) -> str | None:
     """Extract a likely calendar event title from prompt text."""
-    quoted = re.search(r"(?:titel|title)?\s*[\"'“”„](.+?)[\"'“”„]", prompt, re.I)
-    if quoted:
-        return quoted.group(1)
-
-    titled = re.search(
-        r"\b(?:titel|title)\s+([a-zA-Z0-9äöüÄÖÜß][\wäöüÄÖÜß\-\s]{2,120})",
-        prompt,
-        re.I,
-    )
+    quoted = _find_quoted(prompt)
+    if quoted is not None:
+        return quoted
+
+    titled = _TITLE_KW_RE.search(prompt)
     if titled:
-        candidate = re.split(
-            r"\b(?:am|um|ab|von|fuer|für|dauer|start|ende|hinzu)\b",
-            titled.group(1),
-            flags=re.I,
-        )[0]
+        candidate = _TITLE_SPLIT_RE.split(titled.group(1))[0]
         return candidate.strip() or None
 
-    match = re.search(
-        r"\b(?:termin|event)\s+(?:mit\s+dem\s+titel\s+)?([a-zA-Z0-9äöüÄÖÜß][\wäöüÄÖÜß\-\s]{2,120})",
-        prompt,
-        re.I,
-    )
+    match = _TITLE_EVENT_RE.search(prompt)
     if not match:
         return None
-    candidate = re.split(
-        r"\b(?:am|um|ab|von|fuer|für|dauer|start|ende|hinzu)\b",
-        match.group(1),
-        flags=re.I,
-    )[0]
+    candidate = _TITLE_SPLIT_RE.split(match.group(1))[0]
     return candidate.strip() or None
 
 
@@ -236,38 +300,29 @@ def extract_datetime_literal(
     now_fn: Callable[[], datetime] | None = None,
 ) -> str | None:
     """Extract ISO, German, or relative date-time literals from prompt text."""
-    iso_match = re.search(
-        r"\b(\d{4}-\d{2}-\d{2}[T\s]\d{1,2}:\d{2}(?::\d{2})?)\b",
-        prompt,
-    )
+    iso_match = _ISO_LITERAL_RE.search(prompt)
     if iso_match:
-        return normalize_calendar_datetime_input(
-            iso_match.group(1),
-            now_fn=now_fn,
-        )
+        return _iso_datetime(iso_match.group(1), now_fn=now_fn)
 
-    de_match = re.search(
-        r"\b(\d{1,2}\.\d{1,2}\.\d{4})\s*(?:um|,)?\s*(\d{1,2}[:.]\d{2})\b",
-        prompt,
-        re.I,
-    )
+    de_match = _DE_LITERAL_RE.search(prompt)
     if de_match:
-        date_part, time_part = de_match.groups()
-        return normalize_calendar_datetime_input(
-            f"{date_part} {time_part.replace('.', ':')}",
+        day, month, year, hour_raw, minute_raw = de_match.groups()
+        return _absolute_datetime(
+            year=int(year),
+            month=int(month),
+            day=int(day),
+            hour=int(hour_raw),
+            minute=int(minute_raw),
             now_fn=now_fn,
         )
 
-    relative_match = re.search(
-        r"\b(heute|morgen|uebermorgen|übermorgen)\s*(?:um\s*)?(\d{1,2})(?:[:.](\d{2}))?\s*uhr?\b",
-        prompt,
-        re.I,
-    )
+    relative_match = _REL_LITERAL_RE.search(prompt)
     if relative_match:
         day_token, hour_raw, minute_raw = relative_match.groups()
-        minute = minute_raw or "00"
-        return normalize_calendar_datetime_input(
-            f"{day_token} {hour_raw}:{minute}",
+        return _relative_datetime(
+            day_token,
+            hour=int(hour_raw),
+            minute=int(minute_raw or "0"),
             now_fn=now_fn,
         )
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from typing import Callable
 
 from shared.defaults import DEFAULT_FOCUS_TOPIC_DE, DEFAULT_TIMER_MINUTES
 from contracts.tool_contract import (
@@ -21,12 +22,59 @@ from contracts.tool_contract import (
     TOOL_STOP_TIMER,
 )
 
-from .types import ToolCall
+from .types import JSONObject, ToolCall
+
+_START_PHRASE_RE = re.compile(r"\s*(?:sure|okay|i can|let me|here is)\b")
+_WORD_RE = re.compile(r"\w+")
+_UMLAUT_CHARS = frozenset("äöüß")
+
+_ENGLISH_WORDS: frozenset[str] = frozenset(
+    {
+        "the", "and", "you", "your", "what", "should", "sorry", "could",
+        "please", "hello", "thanks", "let", "lets", "sure", "okay", "can",
+        "is", "are", "was", "were", "has", "have", "been", "will",
+        "started", "starting", "paused", "running",
+    }
+)
+
+_GERMAN_WORDS: frozenset[str] = frozenset(
+    {
+        "ich", "du", "dein", "deine", "bitte", "heute", "timer", "sitzung",
+        "fokus", "starten", "pausieren", "fortsetzen", "abbrechen", "ja",
+        "nein", "gern", "klar",
+    }
+)
+
+
+_STATIC_REPLIES: dict[str, str] = {
+    TOOL_STOP_TIMER: "Ich stoppe den laufenden Timer.",
+    TOOL_PAUSE_TIMER: "Ich pausiere den Timer.",
+    TOOL_CONTINUE_TIMER: "Ich setze den Timer fort.",
+    TOOL_RESET_TIMER: "Ich setze den Timer zurueck.",
+    TOOL_STOP_POMODORO: "Ich stoppe die aktuelle Pomodoro Sitzung.",
+    TOOL_PAUSE_POMODORO: "Ich pausiere die Pomodoro Sitzung.",
+    TOOL_CONTINUE_POMODORO: "Ich setze die Pomodoro Sitzung fort.",
+    TOOL_RESET_POMODORO: "Ich setze die Pomodoro Sitzung zurueck.",
+    TOOL_STATUS_POMODORO: "",  # live timer data; dispatcher always uses snapshot, not this text
+    TOOL_SHOW_UPCOMING_EVENTS: "Ich zeige die anstehenden Termine im gewuenschten Zeitraum.",
+    TOOL_ADD_CALENDAR_EVENT: "Ich lege den Kalendereintrag an.",
+}
+
+_DYNAMIC_REPLIES: dict[str, Callable[[JSONObject], str]] = {
+    TOOL_START_TIMER: lambda arguments: (
+        f"Ich starte den Timer mit der Dauer "
+        f"{arguments.get('duration', str(DEFAULT_TIMER_MINUTES))}."
+    ),
+    TOOL_START_POMODORO: lambda arguments: (
+        f"Ich starte eine Pomodoro Sitzung fuer "
+        f"{arguments.get('focus_topic', DEFAULT_FOCUS_TOPIC_DE)}."
+    ),
+}
 
 
 def normalize_assistant_text(text: str, tool_call: ToolCall | None) -> str:
     """Normalize assistant text and replace weak replies with deterministic fallbacks."""
-    normalized = re.sub(r"\s+", " ", text).strip()
+    normalized = " ".join(text.split())
     if not normalized:
         return fallback_assistant_text(tool_call)
     if (
@@ -42,23 +90,21 @@ def normalize_assistant_text(text: str, tool_call: ToolCall | None) -> str:
 def is_probably_english(text: str) -> bool:
     """Heuristically detect whether a response is likely written in English."""
     lowered = text.lower()
-    if re.search(r"^\s*(sure|okay|i can|let me|here is)\b", lowered):
+    if _START_PHRASE_RE.match(lowered):
         return True
+    # Umlauts veto the English verdict, and most replies are German, so check
+    # them before tokenizing.
+    if not _UMLAUT_CHARS.isdisjoint(lowered):
+        return False
 
-    english_hits = len(
-        re.findall(
-            r"\b(the|and|you|your|what|should|sorry|could|please|hello|thanks|let|lets|sure|okay|can|is|are|was|were|has|have|been|will|started|starting|paused|running)\b",
-            lowered,
-        )
-    )
-    german_hits = len(
-        re.findall(
-            r"\b(ich|du|dein|deine|bitte|heute|timer|sitzung|fokus|starten|pausieren|fortsetzen|abbrechen|ja|nein|gern|klar)\b",
-            lowered,
-        )
-    )
-    has_umlaut = bool(re.search(r"[äöüß]", lowered))
-    return english_hits >= 2 and english_hits >= (german_hits + 1) and not has_umlaut
+    english_hits = 0
+    german_hits = 0
+    for word in _WORD_RE.findall(lowered):
+        if word in _ENGLISH_WORDS:
+            english_hits += 1
+        elif word in _GERMAN_WORDS:
+            german_hits += 1
+    return english_hits >= 2 and english_hits >= (german_hits + 1)
 
 
 def fallback_assistant_text(tool_call: ToolCall | None) -> str:
@@ -67,32 +113,10 @@ def fallback_assistant_text(tool_call: ToolCall | None) -> str:
         return "Entschuldigung, das habe ich glaube ich nicht verstanden."
 
     name = tool_call["name"]
-    if name == TOOL_START_TIMER:
-        duration = tool_call["arguments"].get("duration", str(DEFAULT_TIMER_MINUTES))
-        return f"Ich starte den Timer mit der Dauer {duration}."
-    if name == TOOL_STOP_TIMER:
-        return "Ich stoppe den laufenden Timer."
-    if name == TOOL_PAUSE_TIMER:
-        return "Ich pausiere den Timer."
-    if name == TOOL_CONTINUE_TIMER:
-        return "Ich setze den Timer fort."
-    if name == TOOL_RESET_TIMER:
-        return "Ich setze den Timer zurueck."
-    if name == TOOL_START_POMODORO:
-        topic = tool_call["arguments"].get("focus_topic", DEFAULT_FOCUS_TOPIC_DE)
-        return f"Ich starte eine Pomodoro Sitzung fuer {topic}."
-    if name == TOOL_STOP_POMODORO:
-        return "Ich stoppe die aktuelle Pomodoro Sitzung."
-    if name == TOOL_PAUSE_POMODORO:
-        return "Ich pausiere die Pomodoro Sitzung."
-    if name == TOOL_CONTINUE_POMODORO:
-        return "Ich setze die Pomodoro Sitzung fort."
-    if name == TOOL_RESET_POMODORO:
-        return "Ich setze die Pomodoro Sitzung zurueck."
-    if name == TOOL_STATUS_POMODORO:
-        return ""  # live timer data; dispatcher always uses snapshot, not this text
-    if name == TOOL_SHOW_UPCOMING_EVENTS:
-        return "Ich zeige die anstehenden Termine im gewuenschten Zeitraum."
-    if name == TOOL_ADD_CALENDAR_EVENT:
-        return "Ich lege den Kalendereintrag an."
+    static_reply = _STATIC_REPLIES.get(name)
+    if static_reply is not None:
+        return static_reply
+    dynamic_reply = _DYNAMIC_REPLIES.get(name)
+    if dynamic_reply is not None:
+        return dynamic_reply(tool_call["arguments"])
     return "Anfrage verarbeitet."
@@ -21,64 +21,78 @@ ACTION_PATTERNS: dict[str, re.Pattern[str]] = {
     ACTION_RESET: re.compile(r"\b(reset|zuruecksetzen|neu starten|von vorne)\b", re.I),
 }
 
+# Later ACTION_PATTERNS entries win ties at the same position, so the combined
+# alternation lists them in reverse order (e.g. "stopp kurz" resolves to stop).
+_ACTION_GROUP_TO_ACTION: dict[str, str] = {
+    f"action{index}": action for index, action in enumerate(reversed(ACTION_PATTERNS))
+}
+_COMBINED_ACTION_RE = re.compile(
+    "|".join(
+        f"(?P<{group}>{ACTION_PATTERNS[action].pattern})"
+        for group, action in _ACTION_GROUP_TO_ACTION.items()
+    ),
+    re.I,
+)
+
+_POMODORO_CONTEXT_PATTERN = re.compile(r"\b(pomodoro|fokus|fokussitzung|sitzung)\b")
+_TIMER_CONTEXT_PATTERN = re.compile(r"\b(timer|countdown)\b")
+_ADD_CALENDAR_NOUN_PATTERN = re.compile(r"\b(kalender|termin|event)\b")
+_ADD_CALENDAR_VERB_PATTERN = re.compile(
+    r"\b(hinzufuegen|hinzufueg|hinzufügen|fuege|füge|hinzu|anlegen|erstell(?:e|en|t)?|eintragen|planen)\b"
+)
+_POMODORO_STATUS_PATTERN = re.compile(
+    r"\b(wie lange|wie viel|status|wie steht|wie laeuft|verbleibend|restzeit|wie weit)\b"
+)
+_SHOW_EVENTS_NOUN_PATTERN = re.compile(r"\b(kalender|termin|termine|event|events)\b")
+_SHOW_EVENTS_VERB_PATTERN = re.compile(
+    r"\b(zeigen|zeige|anzeigen|welche|anstehend|kommend|bevorstehend|was steht an)\b"
+)
+_TELL_JOKE_PATTERN = re.compile(
+    r"\b(witz|witze|scherz|joke|erzähl mir einen|erzaehl mir einen)\b"
+)
+
 
 def detect_action(prompt: str) -> str | None:
     """Detect the latest matching action keyword in the prompt text."""
-    matches: list[tuple[int, str]] = []
-    for action, pattern in ACTION_PATTERNS.items():
-        for match in pattern.finditer(prompt):
-            matches.append((match.start(), action))
-    if not matches:
+    last_group: str | None = None
+    for match in _COMBINED_ACTION_RE.finditer(prompt):
+        last_group = match.lastgroup
+    if last_group is None:
         return None
-    matches.sort(key=lambda item: item[0])
-    return matches[-1][1]
+    return _ACTION_GROUP_TO_ACTION[last_group]
 
 
 def has_pomodoro_context(text: str) -> bool:
     """Return whether text mentions pomodoro-like session context."""
-    return bool(re.search(r"\b(pomodoro|fokus|fokussitzung|sitzung)\b", text))
+    return _POMODORO_CONTEXT_PATTERN.search(text) is not None
 
 
 def has_timer_context(text: str) -> bool:
     """Return whether text explicitly references timer context."""
-    return bool(re.search(r"\b(timer|countdown)\b", text))
+    return _TIMER_CONTEXT_PATTERN.search(text) is not None
 
 
 def looks_like_add_calendar(lowered_prompt: str) -> bool:
     """Heuristically detect calendar creation intent from prompt text."""
-    has_calendar = bool(re.search(r"\b(kalender|termin|event)\b", lowered_prompt))
-    has_create = bool(
-        re.search(
-            r"\b(hinzufuegen|hinzufueg|hinzufügen|fuege|füge|hinzu|anlegen|erstell(?:e|en|t)?|eintragen|planen)\b",
-            lowered_prompt,
-        )
+    return (
+        _ADD_CALENDAR_NOUN_PATTERN.search(lowered_prompt) is not None
+        and _ADD_CALENDAR_VERB_PATTERN.search(lowered_prompt) is not None
     )
-    return has_calendar and has_create
 
 
 def looks_like_pomodoro_status(lowered_prompt: str) -> bool:
     """Return whether text looks like a pomodoro status/remaining-time query."""
-    return bool(re.search(
-        r"\b(wie lange|wie viel|status|wie steht|wie laeuft|verbleibend|restzeit|wie weit)\b",
-        lowered_prompt,
-    ))
+    return _POMODORO_STATUS_PATTERN.search(lowered_prompt) is not None
 
 
 def looks_like_show_events(lowered_prompt: str) -> bool:
     """Heuristically detect calendar listing intent from prompt text."""
-    has_calendar = bool(re.search(r"\b(kalender|termin|termine|event|events)\b", lowered_prompt))
-    has_show = bool(
-        re.search(
-            r"\b(zeigen|zeige|anzeigen|welche|anstehend|kommend|bevorstehend|was steht an)\b",
-            lowered_prompt,
-        )
+    return (
+        _SHOW_EVENTS_NOUN_PATTERN.search(lowered_prompt) is not None
+        and _SHOW_EVENTS_VERB_PATTERN.search(lowered_prompt) is not None
     )
-    return has_calendar and has_show
 
 
 def looks_like_tell_joke(lowered_prompt: str) -> bool:
     """Return whether text looks like a request for a joke."""
-    return bool(re.search(
-        r"\b(witz|witze|scherz|joke|erzähl mir einen|erzaehl mir einen)\b",
-        lowered_prompt,
-    ))
+    return _TELL_JOKE_PATTERN.search(lowered_prompt) is not None
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from uuid import uuid4
 
@@ -18,6 +20,44 @@ from .llama_backend import LlamaBackend
 from .parser import ResponseParser
 from .types import EnvironmentContext, StructuredResponse
 
+_ENVIRONMENT_PLACEHOLDER_RE = re.compile(
+    r"\{(current_time|current_date|next_appointment|air_quality|ambient_light)\}"
+)
+
+
+@lru_cache(maxsize=4)
+def _resolve_system_prompt_candidates(
+    raw: str,
+    bundle_root_raw: str | None,
+) -> tuple[str, ...]:
+    source = Path(raw).expanduser()
+    candidates: list[Path] = []
+
+    def append_unique(value: Path) -> None:
+        if value not in candidates:
+            candidates.append(value)
+
+    append_unique(source)
+
+    if bundle_root_raw:
+        bundle_root = Path(bundle_root_raw)
+
+        if not source.is_absolute():
+            append_unique(bundle_root / source)
+
+        try:
+            prompts_index = source.parts.index("prompts")
+        except ValueError:
+            prompts_index = -1
+
+        if prompts_index >= 0:
+            append_unique(bundle_root / Path(*source.parts[prompts_index:]))
+
+        append_unique(bundle_root / "prompts" / source.name)
+        append_unique(bundle_root / source.name)
+
+    return tuple(str(candidate) for candidate in candidates)
+
 
 class PomodoroAssistantLLM:
     """End-to-end assistant wrapper that renders prompts and parses structured replies."""
@@ -28,6 +68,8 @@ class PomodoroAssistantLLM:
         self._backend = LlamaBackend(config)
         self._system_prompt_template = self._build_system_message()
         self._last_tokens: int = 0
+        self._rendered_system_key: tuple[str, ...] | None = None
+        self._rendered_system_message = ""
 
     @classmethod
     def from_model_path(
@@ -115,35 +157,10 @@ class PomodoroAssistantLLM:
         raw = path.strip()
         if not raw:
             return []
-
-        source = Path(raw).expanduser()
-        candidates: list[Path] = []
-
-        def append_unique(value: Path) -> None:
-            if value not in candidates:
-                candidates.append(value)
-
-        append_unique(source)
-
         bundle_root_raw = getattr(sys, "_MEIPASS", None)
-        if isinstance(bundle_root_raw, str) and bundle_root_raw:
-            bundle_root = Path(bundle_root_raw)
-
-            if not source.is_absolute():
-                append_unique(bundle_root / source)
-
-            try:
-                prompts_index = source.parts.index("prompts")
-            except ValueError:
-                prompts_index = -1
-
-            if prompts_index >= 0:
-                append_unique(bundle_root / Path(*source.parts[prompts_index:]))
-
-            append_unique(bundle_root / "prompts" / source.name)
-            append_unique(bundle_root / source.name)
-
-        return [str(candidate) for candidate in candidates]
+        if not isinstance(bundle_root_raw, str):
+            bundle_root_raw = None
+        return list(_resolve_system_prompt_candidates(raw, bundle_root_raw))
 
     @staticmethod
     def _default_system_message() -> str:
@@ -293,11 +310,21 @@ class PomodoroAssistantLLM:
         return self._last_tokens
 
     def _render_system_message(self, env: EnvironmentContext | None) -> str:
-        content = self._system_prompt_template
+        template = self._system_prompt_template
         placeholders = self._resolve_environment_placeholders(env)
-        for key, value in placeholders.items():
-            content = content.replace("{" + key + "}", value)
-        return content
+        # Consecutive requests usually share the same minute and sensor data,
+        # so keep the last rendering and skip the template walk on a repeat.
+        render_key = (template, *placeholders.values())
+        if render_key == self._rendered_system_key:
+            return self._rendered_system_message
+
+        rendered = _ENVIRONMENT_PLACEHOLDER_RE.sub(
+            lambda match: placeholders[match.group(1)],
+            template,
+        )
+        self._rendered_system_key = render_key
+        self._rendered_system_message = rendered
+        return rendered
 
     @staticmethod
     def _default_environment_placeholders() -> dict[str, str]:
@@ -6,6 +6,7 @@ import json
 import datetime as dt
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TypeAlias, TypedDict
 
 from contracts.tool_contract import ToolName  # noqa: F401 (re-export)
@@ -15,6 +16,48 @@ JSONValue: TypeAlias = "JSONScalar | JSONObject | JSONArray"
 JSONObject: TypeAlias = dict[str, "JSONValue"]
 JSONArray: TypeAlias = list["JSONValue"]
 
+_WEEKDAYS_DE = (
+    "Montag",
+    "Dienstag",
+    "Mittwoch",
+    "Donnerstag",
+    "Freitag",
+    "Samstag",
+    "Sonntag",
+)
+_MONTHS_DE = (
+    "Januar",
+    "Februar",
+    "Maerz",
+    "April",
+    "Mai",
+    "Juni",
+    "Juli",
+    "August",
+    "September",
+    "Oktober",
+    "November",
+    "Dezember",
+)
+_AIR_QUALITY_FIELDS = (
+    ("aqi", "AQI {}"),
+    ("tvoc_ppb", "TVOC {} ppb"),
+    ("eco2_ppm", "eCO2 {} ppm"),
+)
+_ALL_DAY_DATE_RE = re.compile(r"\s*\d{4}-\d{2}-\d{2}\s*")
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_datetime(raw: str) -> dt.datetime | None:
+    value = raw.strip()
+    if not value:
+        return None
+
+    try:
+        return dt.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
 
 class ToolCall(TypedDict):
     """Typed structure for a single normalized runtime tool invocation."""
@@ -38,53 +81,31 @@ class EnvironmentContext:
     upcoming_events: list[JSONObject] | None = None
 
     def to_prompt_placeholders(self) -> dict[str, str]:
+        now = self._parse_now_local()
         return {
-            "current_time": self._format_current_time(),
-            "current_date": self._format_current_date(),
-            "next_appointment": self._format_next_appointment(),
+            "current_time": self._format_current_time(now),
+            "current_date": self._format_current_date(now),
+            "next_appointment": self._format_next_appointment(now),
             "air_quality": self._format_air_quality(),
             "ambient_light": self._format_ambient_light(),
         }
 
-    def _format_current_time(self) -> str:
-        now = self._parse_now_local()
+    @staticmethod
+    def _format_current_time(now: dt.datetime | None) -> str:
         if now is None:
             return "Unbekannte Zeit"
-        return now.strftime("%H:%M")
+        return f"{now.hour:02d}:{now.minute:02d}"
 
-    def _format_current_date(self) -> str:
-        now = self._parse_now_local()
+    @staticmethod
+    def _format_current_date(now: dt.datetime | None) -> str:
         if now is None:
             return "Unbekanntes Datum"
 
-        weekdays = (
-            "Montag",
-            "Dienstag",
-            "Mittwoch",
-            "Donnerstag",
-            "Freitag",
-            "Samstag",
-            "Sonntag",
-        )
-        months = (
-            "Januar",
-            "Februar",
-            "Maerz",
-            "April",
-            "Mai",
-            "Juni",
-            "Juli",
-            "August",
-            "September",
-            "Oktober",
-            "November",
-            "Dezember",
-        )
-        weekday = weekdays[now.weekday()]
-        month = months[now.month - 1]
+        weekday = _WEEKDAYS_DE[now.weekday()]
+        month = _MONTHS_DE[now.month - 1]
         return f"{weekday}, {now.day}. {month} {now.year}"
 
-    def _format_next_appointment(self) -> str:
+    def _format_next_appointment(self, now: dt.datetime | None) -> str:
         events = self.upcoming_events or []
         if not events:
             return "Kein anstehender Termin"
@@ -93,7 +114,11 @@ class EnvironmentContext:
         summary = str(first_event.get("summary") or "Termin ohne Titel").strip()
         start_raw = first_event.get("start")
         end_raw = first_event.get("end")
-        event_text = self._format_event_window(start_raw, end_raw)
+        event_text = self._format_event_window(
+            start_raw,
+            end_raw,
+            reference=now or dt.datetime.now().astimezone(),
+        )
         if event_text:
             return f"{summary} ({event_text})"
         return summary
@@ -105,16 +130,11 @@ class EnvironmentContext:
         if not isinstance(payload, dict):
             return str(payload)
 
-        parts: list[str] = []
-        aqi = payload.get("aqi")
-        if aqi is not None:
-            parts.append(f"AQI {aqi}")
-        tvoc = payload.get("tvoc_ppb")
-        if tvoc is not None:
-            parts.append(f"TVOC {tvoc} ppb")
-        eco2 = payload.get("eco2_ppm")
-        if eco2 is not None:
-            parts.append(f"eCO2 {eco2} ppm")
+        parts = [
+            template.format(value)
+            for key, template in _AIR_QUALITY_FIELDS
+            if (value := payload.get(key)) is not None
+        ]
         if parts:
             return ", ".join(parts)
 
@@ -130,90 +150,87 @@ class EnvironmentContext:
         return f"{value:.2f}".rstrip("0").rstrip(".") + " lux"
 
     def _parse_now_local(self) -> dt.datetime | None:
-        value = self.now_local.strip()
-        if not value:
-            return None
-
-        normalized = value[:-1] + "+00:00" if value.endswith("Z") else value
-        try:
-            return dt.datetime.fromisoformat(normalized)
-        except ValueError:
-            return None
-
-    @staticmethod
-    def _to_reference_timezone(
-        value: dt.datetime,
-        *,
-        reference: dt.datetime,
-    ) -> dt.datetime:
-        target_tz = reference.tzinfo or dt.timezone.utc
-        if value.tzinfo is None:
-            return value.replace(tzinfo=target_tz)
-        return value.astimezone(target_tz)
+        return _parse_iso_datetime(self.now_local)
 
     @staticmethod
     def _relative_day_label(target: dt.date, reference: dt.date) -> str:
-        if target == reference:
+        day_delta = target.toordinal() - reference.toordinal()
+        if day_delta == 0:
             return "heute"
-        if target == (reference + dt.timedelta(days=1)):
+        if day_delta == 1:
             return "morgen"
-        if target == (reference - dt.timedelta(days=1)):
+        if day_delta == -1:
             return "gestern"
         return f"am {target.day:02d}.{target.month:02d}.{target.year}"
 
-    def _parse_event_datetime(self, value: object) -> dt.datetime | None:
+    def _parse_event_datetime(
+        self,
+        value: object,
+        *,
+        reference: dt.datetime,
+    ) -> dt.datetime | None:
         if not isinstance(value, str):
             return None
-        raw = value.strip()
-        if not raw:
-            return None
-
-        normalized = raw[:-1] + "+00:00" if raw.endswith("Z") else raw
-        try:
-            parsed = dt.datetime.fromisoformat(normalized)
-        except ValueError:
+        parsed = _parse_iso_datetime(value)
+        if parsed is None:
             return None
 
-        reference = self._parse_now_local() or dt.datetime.now().astimezone()
-        return self._to_reference_timezone(parsed, reference=reference)
+        target_tz = reference.tzinfo or dt.timezone.utc
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=target_tz)
+        return parsed.astimezone(target_tz)
 
     @staticmethod
     def _is_all_day_date_string(value: object) -> bool:
         if not isinstance(value, str):
             return False
-        return bool(re.fullmatch(r"\d{4}-\d{2}-\d{2}", value.strip()))
-
-    def _format_event_point(self, value: object) -> str | None:
-        parsed = self._parse_event_datetime(value)
-        if parsed is None:
-            return None
+        return _ALL_DAY_DATE_RE.fullmatch(value) is not None
 
-        reference = self._parse_now_local() or dt.datetime.now().astimezone()
+    def _format_event_point(
+        self,
+        parsed: dt.datetime,
+        *,
+        all_day: bool,
+        reference: dt.datetime,
+    ) -> str:
         day_label = self._relative_day_label(parsed.date(), reference.date())
-        if self._is_all_day_date_string(value):
+        if all_day:
             return f"{day_label}, ganztaegig"
-        return f"{day_label} um {parsed.strftime('%H:%M')}"
+        return f"{day_label} um {parsed.hour:02d}:{parsed.minute:02d}"
 
-    def _format_event_window(self, start_value: object, end_value: object) -> str | None:
-        start_point = self._format_event_point(start_value)
-        if start_point is None:
+    def _format_event_window(
+        self,
+        start_value: object,
+        end_value: object,
+        *,
+        reference: dt.datetime,
+    ) -> str | None:
+        start_dt = self._parse_event_datetime(start_value, reference=reference)
+        if start_dt is None:
             return None
-        if self._is_all_day_date_string(start_value):
+
+        start_all_day = self._is_all_day_date_string(start_value)
+        start_point = self._format_event_point(
+            start_dt,
+            all_day=start_all_day,
+            reference=reference,
+        )
+        if start_all_day:
             return start_point
 
-        start_dt = self._parse_event_datetime(start_value)
-        end_dt = self._parse_event_datetime(end_value)
-        if start_dt is None or end_dt is None:
+        end_dt = self._parse_event_datetime(end_value, reference=reference)
+        if end_dt is None:
             return start_point
 
         if start_dt.date() == end_dt.date():
-            reference = self._parse_now_local() or dt.datetime.now().astimezone()
             day_label = self._relative_day_label(start_dt.date(), reference.date())
-            return f"{day_label} von {start_dt.strftime('%H:%M')} bis {end_dt.strftime('%H:%M')}"
+            return f"{day_label} von {start_dt.hour:02d}:{start_dt.minute:02d} bis {end_dt.hour:02d}:{end_dt.minute:02d}"
 
-        end_point = self._format_event_point(end_value)
-        if end_point is None:
-            return start_point
+        end_point = self._format_event_point(
+            end_dt,
+            all_day=self._is_all_day_date_string(end_value),
+            reference=reference,
+        )
         return f"von {start_point} bis {end_point}"
 
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import multiprocessing
 import signal
 import sys
 import time
+from functools import lru_cache
 from logging.handlers import QueueListener
+from operator import itemgetter
 from multiprocessing.queues import Queue as MPQueue
 from types import FrameType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from config import (
     AppConfig,
@@ -19,13 +22,22 @@ from config import (
     resolve_config_path,
 )
 from contracts import StartupError
-from oracle.factory import create_oracle_service
-from server.factory import create_ui_server
 
 if TYPE_CHECKING:
     from stt.service import WakeWordService
 
 LogQueue = MPQueue
+T = TypeVar("T")
+
+# The three workers load their models at once and compete for the CPU (STT
+# also warms up before reporting ready), so the first start gets more time
+# than a single worker's restart.
+_CONCURRENT_STARTUP_TIMEOUT_SECONDS = 60.0
+
+_SIGNAL_NAMES: dict[int, str] = {
+    signal.SIGTERM: signal.SIGTERM.name,
+    signal.SIGINT: signal.SIGINT.name,
+}
 
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
@@ -40,32 +52,31 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
 
 
 def setup_signal_handlers(service: WakeWordService) -> None:
+    # The handler runs on the main thread between bytecodes, possibly while the
+    # runtime loop holds the service's running lock. Stopping the service here
+    # could deadlock, so it only unwinds; RuntimeEngine's shutdown path stops
+    # the service once the SystemExit has left the loop.
+    del service
     logger = logging.getLogger("wake_word_app")
 
     def signal_handler(signum: int, frame: FrameType | None) -> None:
         del frame
-        signal_name = signal.Signals(signum).name
-        logger.info("%s received, stopping...", signal_name)
-        try:
-            service.stop()
-        except Exception as error:  # pragma: no cover - only on abnormal shutdown
-            logger.error("Error while stopping service on %s: %s", signal_name, error)
+        logger.info("%s received, stopping...", _SIGNAL_NAMES.get(signum, str(signum)))
         raise SystemExit(0)
 
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+    for handled_signal in _SIGNAL_NAMES:
+        signal.signal(handled_signal, signal_handler)
 
 
 def _wait_for_service_ready_callback(service: WakeWordService, timeout: float = 10.0) -> bool:
     deadline = time.monotonic() + timeout
     poll_interval_seconds = 0.25
 
-    while time.monotonic() < deadline:
+    while (now := time.monotonic()) < deadline:
         if not service.is_running:
             return False
 
-        remaining = deadline - time.monotonic()
-        wait_seconds = min(poll_interval_seconds, max(remaining, 0.0))
+        wait_seconds = min(poll_interval_seconds, deadline - now)
         if service.wait_until_ready(timeout=wait_seconds):
             return True
 
@@ -93,6 +104,7 @@ def _start_log_listener() -> tuple[LogQueue, QueueListener]:
     return log_queue, listener
 
 
+@lru_cache(maxsize=1)
 def _load_runtime_engine():
     try:
         from runtime import RuntimeEngine
@@ -101,6 +113,25 @@ def _load_runtime_engine():
     return RuntimeEngine
 
 
+@lru_cache(maxsize=1)
+def _load_oracle_factory():
+    try:
+        from oracle.factory import create_oracle_service
+    except ImportError as error:
+        raise StartupError(f"Oracle import error: {error}")
+    return create_oracle_service
+
+
+@lru_cache(maxsize=1)
+def _load_ui_server_factory():
+    try:
+        from server.factory import create_ui_server
+    except ImportError as error:
+        raise StartupError(f"UI server import error: {error}")
+    return create_ui_server
+
+
+@lru_cache(maxsize=1)
 def _load_worker_factories():
     try:
         from runtime.workers import (
@@ -113,6 +144,33 @@ def _load_worker_factories():
     return create_stt_worker, create_llm_worker, create_tts_worker
 
 
+def _completed_result(future: concurrent.futures.Future[T]) -> T | None:
+    if future.cancelled() or future.exception() is not None:
+        return None
+    return future.result()
+
+
+def _close_when_started(
+    future: concurrent.futures.Future[object] | None,
+    *,
+    label: str,
+    logger: logging.Logger,
+    client: Callable[[Any], object | None] = lambda result: result,
+) -> None:
+    """Close the worker a startup future produced, now or once it finishes."""
+    if future is None:
+        return
+
+    def close_result(done: concurrent.futures.Future[object]) -> None:
+        result = _completed_result(done)
+        if result is not None:
+            _safe_close(client(result), label=label, logger=logger)
+
+    # Runs immediately for finished futures; a startup still in flight after an
+    # interrupt is closed by its pool thread once it completes.
+    future.add_done_callback(close_result)
+
+
 def _safe_close(resource: object | None, *, label: str, logger: logging.Logger) -> None:
     if resource is None:
         return
@@ -127,9 +185,9 @@ def _safe_close(resource: object | None, *, label: str, logger: logging.Logger)
 
 def main() -> int:
     logger = setup_logging(level=logging.INFO)
-    stt_client = None
-    speech_service = None
-    assistant_llm = None
+    stt_future: concurrent.futures.Future[object] | None = None
+    tts_future: concurrent.futures.Future[object] | None = None
+    llm_future: concurrent.futures.Future[object] | None = None
     log_listener: QueueListener | None = None
 
     try:
@@ -138,25 +196,58 @@ def main() -> int:
         log_level = logging.getLogger().getEffectiveLevel()
         create_stt_worker, create_llm_worker, create_tts_worker = _load_worker_factories()
 
-        wake_word_config, stt_client = create_stt_worker(
-            wake_word=app_config.wake_word,
-            stt=app_config.stt,
-            pico_key=secret_config.pico_voice_access_key,
-            log_queue=log_queue,
-            log_level=log_level,
-        )
-        speech_service = create_tts_worker(
-            tts=app_config.tts,
-            log_queue=log_queue,
-            log_level=log_level,
-        )
-        assistant_llm = create_llm_worker(
-            llm=app_config.llm,
-            hf_token=secret_config.hf_token,
-            log_queue=log_queue,
-            log_level=log_level,
-            logger=logger,
+        # Each worker blocks until its subprocess has loaded its model, so the
+        # three are started side by side instead of one after another.
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=3,
+            thread_name_prefix="worker-startup",
         )
+        try:
+            stt_future = executor.submit(
+                create_stt_worker,
+                wake_word=app_config.wake_word,
+                stt=app_config.stt,
+                pico_key=secret_config.pico_voice_access_key,
+                log_queue=log_queue,
+                log_level=log_level,
+                initial_startup_timeout_seconds=_CONCURRENT_STARTUP_TIMEOUT_SECONDS,
+            )
+            tts_future = executor.submit(
+                create_tts_worker,
+                tts=app_config.tts,
+                log_queue=log_queue,
+                log_level=log_level,
+                initial_startup_timeout_seconds=_CONCURRENT_STARTUP_TIMEOUT_SECONDS,
+            )
+            llm_future = executor.submit(
+                create_llm_worker,
+                llm=app_config.llm,
+                hf_token=secret_config.hf_token,
+                log_queue=log_queue,
+                log_level=log_level,
+                logger=logger,
+                initial_startup_timeout_seconds=_CONCURRENT_STARTUP_TIMEOUT_SECONDS,
+            )
+            done, _ = concurrent.futures.wait(
+                (stt_future, tts_future, llm_future),
+                return_when=concurrent.futures.FIRST_EXCEPTION,
+            )
+        finally:
+            # Loads still running after a failure or interrupt finish on their
+            # pool threads; the finally block below closes them once done.
+            executor.shutdown(wait=False)
+
+        # A fast failure (e.g. a rejected Picovoice key) is re-raised without
+        # waiting for the slower model loads; workers that did start are
+        # closed by the finally block.
+        for future in (stt_future, tts_future, llm_future):
+            error = future.exception() if future in done else None
+            if error is not None:
+                raise error
+        wake_word_config, stt_client = stt_future.result()
+        speech_service = tts_future.result()
+        assistant_llm = llm_future.result()
+
         if assistant_llm is None and speech_service is not None:
             logger.warning(
                 "TTS is enabled but LLM is disabled; no spoken reply will be generated."
@@ -164,14 +255,16 @@ def main() -> int:
 
         oracle_service = None
         if assistant_llm is not None:
-            oracle_service = create_oracle_service(
+            oracle_service = _load_oracle_factory()(
                 oracle=app_config.oracle,
                 calendar_id=secret_config.oracle_google_calendar_id,
                 service_account_file=secret_config.oracle_google_service_account_file,
                 logger=logger,
             )
 
-        ui_server = create_ui_server(ui=app_config.ui_server, logger=logger)
+        ui_server = None
+        if app_config.ui_server.enabled:
+            ui_server = _load_ui_server_factory()(ui=app_config.ui_server, logger=logger)
 
         return _load_runtime_engine()(
             logger=logger,
@@ -192,9 +285,15 @@ def main() -> int:
         logger.exception("Unhandled startup failure")
         return 1
     finally:
-        _safe_close(assistant_llm, label="LLM process client", logger=logger)
-        _safe_close(speech_service, label="TTS process client", logger=logger)
-        _safe_close(stt_client, label="STT process client", logger=logger)
+        _close_when_started(llm_future, label="LLM process client", logger=logger)
+        _close_when_started(tts_future, label="TTS process client", logger=logger)
+        _close_when_started(
+            stt_future,
+            label="STT process client",
+            logger=logger,
+            # create_stt_worker returns (wake_word_config, stt_client).
+            client=itemgetter(1),
+        )
         if log_listener is not None:
             log_listener.stop()
 
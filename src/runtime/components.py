@@ -6,17 +6,20 @@ import concurrent.futures
 import logging
 from dataclasses import dataclass
 from queue import Queue
+from typing import TYPE_CHECKING
 
 from config import AppConfig
-from oracle.service import OracleContextService
 from pomodoro import PomodoroCycleState, PomodoroTimer
-from server.service import UIServer
 from shared.defaults import DEFAULT_TIMER_DURATION_SECONDS
 from stt.events import QueueEventPublisher
 
 from .tools.dispatch import RuntimeToolDispatcher
 from .ui import RuntimeUIPublisher
 
+if TYPE_CHECKING:
+    from oracle.service import OracleContextService
+    from server.service import UIServer
+
 
 @dataclass(slots=True)
 class RuntimeComponents:
@@ -6,7 +6,7 @@ import concurrent.futures
 import datetime as dt
 import logging
 from queue import Empty
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from config import AppConfig
 from contracts.ui_protocol import (
@@ -18,9 +18,7 @@ from contracts.ui_protocol import (
     STATE_TRANSCRIBING,
 )
 from llm.types import EnvironmentContext
-from oracle.service import OracleContextService
 from pomodoro.constants import ACTION_SYNC, REASON_STARTUP
-from server.service import UIServer
 from stt.config import WakeWordConfig
 from stt.events import (
     Utterance,
@@ -35,6 +33,10 @@ from .components import RuntimeComponents, _build_runtime_components
 from .ticks import handle_pomodoro_tick, handle_timer_tick
 from .utterance import process_utterance
 
+if TYPE_CHECKING:
+    from oracle.service import OracleContextService
+    from server.service import UIServer
+
 
 def _noop_signal_handlers(service: WakeWordService) -> None:
     del service
@@ -97,6 +99,13 @@ class RuntimeEngine:
         self._pomodoro_cycle = runtime_components.pomodoro_cycle
         self._pending_utterance: concurrent.futures.Future[None] | None = None
         self._wakeword_service: WakeWordService | None = None
+        # WakeWordService publishes exact instances of these types, so the
+        # handler is found with a single lookup on type(event).
+        self._event_handlers: dict[type, Callable[[Any], int | None]] = {
+            WakeWordDetectedEvent: self._on_wake_word_detected,
+            UtteranceCapturedEvent: self._on_utterance_captured,
+            WakeWordErrorEvent: self._on_wake_word_error,
+        }
 
     def run(self) -> int:
         try:
@@ -139,7 +148,7 @@ class RuntimeEngine:
         )
 
     def _build_llm_environment_context(self) -> EnvironmentContext:
-        now_local = dt.datetime.now().astimezone().isoformat(timespec="seconds")
+        now_local = None
         light_level_lux = None
         air_quality = None
         upcoming_events = None
@@ -147,15 +156,19 @@ class RuntimeEngine:
         if self._oracle_service is not None:
             try:
                 payload = self._oracle_service.build_environment_payload()
-                now_local = str(payload.get("now_local") or now_local)
+                now_local = payload.get("now_local")
                 light_level_lux = payload.get("light_level_lux")
                 air_quality = payload.get("air_quality")
                 upcoming_events = payload.get("upcoming_events")
             except Exception as error:
                 self._logger.warning("Failed to collect oracle context: %s", error)
 
+        # The oracle already stamps its payload; only read the clock without one.
+        if not now_local:
+            now_local = dt.datetime.now().astimezone().isoformat(timespec="seconds")
+
         return EnvironmentContext(
-            now_local=now_local,
+            now_local=str(now_local),
             light_level_lux=light_level_lux,
             air_quality=air_quality,
             upcoming_events=upcoming_events,
@@ -252,12 +265,18 @@ class RuntimeEngine:
         except Empty:
             return None
 
-    def _submit_utterance(self, utterance: Utterance) -> None:
+    def _submit_utterance(
+        self,
+        utterance: Utterance,
+        *,
+        duration_seconds: float,
+        audio_bytes: int,
+    ) -> None:
         self._ui.publish_state(
             STATE_TRANSCRIBING,
             message="Transcribing utterance",
-            duration_seconds=round(utterance.duration_seconds, 2),
-            audio_bytes=len(utterance.audio_bytes),
+            duration_seconds=round(duration_seconds, 2),
+            audio_bytes=audio_bytes,
         )
         try:
             self._pending_utterance = self._utterance_executor.submit(
@@ -280,45 +299,75 @@ class RuntimeEngine:
             self._pending_utterance = None
 
     def _handle_event(self, event: object) -> int | None:
-        if isinstance(event, WakeWordDetectedEvent):
-            self._logger.info("Wake word detected at %s", event.occurred_at.isoformat())
-            self._ui.publish_state(STATE_LISTENING, message="Wake word detected")
+        handler = self._event_handlers.get(type(event))
+        if handler is None:
+            self._logger.warning("Ignoring unknown event type: %s", type(event).__name__)
             return None
+        return handler(event)
 
-        if isinstance(event, UtteranceCapturedEvent):
-            utterance = event.utterance
-            self._logger.info(
-                "Captured utterance at %s (duration=%0.2fs, bytes=%d)",
-                utterance.created_at.isoformat(),
-                utterance.duration_seconds,
-                len(utterance.audio_bytes),
-            )
-            pending = self._pending_utterance
-            if pending is not None and not pending.done():
-                self._logger.warning(
-                    "Skipping utterance while previous request is still processing."
-                )
-                self._ui.publish_state(
-                    STATE_THINKING,
-                    message="Previous request still processing",
-                )
-                return None
-
-            self._submit_utterance(utterance)
-            return None
+    def _on_wake_word_detected(self, event: WakeWordDetectedEvent) -> int | None:
+        self._logger.info("Wake word detected at %s", event.occurred_at.isoformat())
+        self._ui.publish_state(STATE_LISTENING, message="Wake word detected")
+        self._prefetch_oracle_context()
+        return None
+
+    def _prefetch_oracle_context(self) -> None:
+        oracle_service = self._oracle_service
+        if oracle_service is None:
+            return
+        # Queued on the single-worker utterance executor, which runs jobs FIFO
+        # on one thread: the prefetch finishes (or fails) before the utterance
+        # captured after this wake word starts, never races it on the oracle
+        # caches, and delays it by at most the fetch that job would otherwise
+        # make itself. Failures are logged in _warm_oracle_context.
+        try:
+            self._utterance_executor.submit(self._warm_oracle_context, oracle_service)
+        except RuntimeError as error:
+            self._logger.warning("Failed to schedule oracle prefetch: %s", error)
 
-        if isinstance(event, WakeWordErrorEvent):
-            self._logger.error(
-                "WakeWordErrorEvent: %s",
-                event.message,
-                exc_info=event.exception,
+    def _warm_oracle_context(self, oracle_service: OracleContextService) -> None:
+        try:
+            oracle_service.build_environment_payload()
+        except Exception as error:
+            self._logger.warning("Failed to prefetch oracle context: %s", error)
+
+    def _on_utterance_captured(self, event: UtteranceCapturedEvent) -> int | None:
+        utterance = event.utterance
+        duration_seconds = utterance.duration_seconds
+        audio_bytes = len(utterance.audio_bytes)
+        self._logger.info(
+            "Captured utterance at %s (duration=%0.2fs, bytes=%d)",
+            utterance.created_at.isoformat(),
+            duration_seconds,
+            audio_bytes,
+        )
+        pending = self._pending_utterance
+        if pending is not None and not pending.done():
+            self._logger.warning(
+                "Skipping utterance while previous request is still processing."
             )
-            self._publish_runtime_error(f"WakeWordErrorEvent: {event.message}")
-            return 1
+            self._ui.publish_state(
+                STATE_THINKING,
+                message="Previous request still processing",
+            )
+            return None
 
-        self._logger.warning("Ignoring unknown event type: %s", type(event).__name__)
+        self._submit_utterance(
+            utterance,
+            duration_seconds=duration_seconds,
+            audio_bytes=audio_bytes,
+        )
         return None
 
+    def _on_wake_word_error(self, event: WakeWordErrorEvent) -> int | None:
+        self._logger.error(
+            "WakeWordErrorEvent: %s",
+            event.message,
+            exc_info=event.exception,
+        )
+        self._publish_runtime_error(f"WakeWordErrorEvent: {event.message}")
+        return 1
+
     def _shutdown(self) -> None:
         self._logger.info("Stopping utterance executor...")
         self._utterance_executor.shutdown(wait=False, cancel_futures=True)
@@ -188,6 +188,7 @@ class _ProcessWorker:
         log_level: int,
         logger: logging.Logger,
         startup_timeout_seconds: float = 30.0,
+        initial_startup_timeout_seconds: float | None = None,
     ):
         self._name = name
         self._runtime_factory = runtime_factory
@@ -203,7 +204,11 @@ class _ProcessWorker:
         self._request_queue: multiprocessing.Queue[object] | None = None
         self._response_queue: multiprocessing.Queue[object] | None = None
         self._process: multiprocessing.Process | None = None
-        self._start_worker(timeout_seconds=startup_timeout_seconds)
+        # A longer first-start budget (e.g. concurrent model loads) does not
+        # stretch the restart path, which keeps startup_timeout_seconds.
+        self._start_worker(
+            timeout_seconds=initial_startup_timeout_seconds or startup_timeout_seconds
+        )
 
     def _start_worker(self, *, timeout_seconds: float) -> None:
         request_queue: multiprocessing.Queue[object] = self._mp_context.Queue()
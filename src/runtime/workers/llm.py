@@ -100,12 +100,23 @@ def _resolve_worker_config(
     return _resolve_pinned_config(config, cpu_cores, logger)
 
 
+def _physical_cpu_count() -> int | None:
+    """Physical core count, or the logical count when psutil cannot tell."""
+    try:
+        import psutil  # type: ignore[import-not-found]
+
+        physical = psutil.cpu_count(logical=False)
+    except Exception:
+        physical = None
+    return physical or os.cpu_count()
+
+
 def _resolve_shared_config(
     config: LLMConfig,
     reserve_cores: int,
     logger: logging.Logger,
 ) -> _WorkerConfig:
-    cpu_count = max(1, os.cpu_count() or config.n_threads)
+    cpu_count = max(1, _physical_cpu_count() or config.n_threads)
     usable = max(1, cpu_count - max(0, reserve_cores))
     adjusted = _cap_threads(config, usable, logger, mode="shared")
     logger.info(
@@ -170,6 +181,7 @@ class LLMWorker:
         logger: logging.Logger | None = None,
         log_queue: MPQueue | None = None,
         log_level: int = logging.INFO,
+        initial_startup_timeout_seconds: float | None = None,
     ) -> None:
         worker_logger = logger or logging.getLogger("llm.process")
         worker_config = _resolve_worker_config(
@@ -187,6 +199,7 @@ class LLMWorker:
             log_queue=log_queue,
             log_level=log_level,
             logger=worker_logger,
+            initial_startup_timeout_seconds=initial_startup_timeout_seconds,
         )
         self._last_tokens: int = 0
 
@@ -235,6 +248,7 @@ def create_llm_worker(
     log_queue: MPQueue,
     log_level: int,
     logger: logging.Logger,
+    initial_startup_timeout_seconds: float | None = None,
 ) -> LLMWorker | None:
     if not llm.enabled:
         return None
@@ -253,6 +267,7 @@ def create_llm_worker(
             logger=logging.getLogger("llm.process"),
             log_queue=log_queue,
             log_level=log_level,
+            initial_startup_timeout_seconds=initial_startup_timeout_seconds,
         )
         logger.info("LLM enabled (model: %s)", llm_config.model_path)
         return worker
@@ -36,6 +36,9 @@ class _STTProcess:
             cpu_threads=config.cpu_threads,
             logger=logging.getLogger("stt.worker"),
         )
+        # Runs before the worker reports ready, overlapping with the other
+        # workers' model loads instead of delaying the first utterance.
+        self._stt.warm_up()
 
     def handle(self, payload: object) -> object:
         from stt.events import Utterance
@@ -58,6 +61,7 @@ class STTWorker:
         logger: logging.Logger | None = None,
         log_queue: MPQueue | None = None,
         log_level: int = logging.INFO,
+        initial_startup_timeout_seconds: float | None = None,
     ):
         worker_logger = logger or logging.getLogger("stt.process")
         worker_config = _WorkerConfig(stt_config=config)
@@ -69,6 +73,7 @@ class STTWorker:
             log_queue=log_queue,
             log_level=log_level,
             logger=worker_logger,
+            initial_startup_timeout_seconds=initial_startup_timeout_seconds,
         )
 
     def transcribe(self, utterance: "Utterance") -> "TranscriptionResult":
@@ -98,6 +103,7 @@ def create_stt_worker(
     log_queue: MPQueue,
     log_level: int,
     logger: logging.Logger | None = None,
+    initial_startup_timeout_seconds: float | None = None,
 ) -> tuple["WakeWordConfig", STTWorker]:
     try:
         wake_word_config, stt_config = create_stt_resources(
@@ -111,6 +117,7 @@ def create_stt_worker(
             logger=logger or logging.getLogger("stt.process"),
             log_queue=log_queue,
             log_level=log_level,
+            initial_startup_timeout_seconds=initial_startup_timeout_seconds,
         )
         return wake_word_config, stt_worker
     except ConfigurationError as error:
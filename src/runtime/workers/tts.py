@@ -61,6 +61,7 @@ class TTSWorker:
         logger: logging.Logger | None = None,
         log_queue: MPQueue | None = None,
         log_level: int = logging.INFO,
+        initial_startup_timeout_seconds: float | None = None,
     ):
         worker_logger = logger or logging.getLogger("tts.process")
         worker_config = _WorkerConfig(tts_config=config)
@@ -72,6 +73,7 @@ class TTSWorker:
             log_queue=log_queue,
             log_level=log_level,
             logger=worker_logger,
+            initial_startup_timeout_seconds=initial_startup_timeout_seconds,
         )
 
     def speak(self, text: str) -> None:
@@ -98,6 +100,7 @@ def create_tts_worker(
     log_queue: MPQueue,
     log_level: int,
     logger: logging.Logger | None = None,
+    initial_startup_timeout_seconds: float | None = None,
 ) -> TTSWorker | None:
     if not tts.enabled:
         return None
@@ -110,6 +113,7 @@ def create_tts_worker(
             logger=logger or logging.getLogger("tts.process"),
             log_queue=log_queue,
             log_level=log_level,
+            initial_startup_timeout_seconds=initial_startup_timeout_seconds,
         )
     except TTSConfigurationError as error:
         raise StartupError(f"TTS configuration error: {error}") from error
@@ -6,6 +6,29 @@ from datetime import datetime, timedelta, timezone
 import re
 from typing import Callable
 
+DAY_OFFSETS: dict[str, int] = {
+    "heute": 0,
+    "morgen": 1,
+    "uebermorgen": 2,
+    "übermorgen": 2,
+}
+
+DURATION_UNIT_MAP: dict[str, str] = {
+    "sek": "s",
+    "sekunde": "s",
+    "sekunden": "s",
+    "s": "s",
+    "min": "m",
+    "minute": "m",
+    "minuten": "m",
+    "m": "m",
+    "stunde": "h",
+    "stunden": "h",
+    "h": "h",
+}
+
+_UNIT_SECONDS: dict[str, int] = {"s": 1, "m": 60, "h": 3600}
+
 
 def resolve_reference_now(now_fn: Callable[[], datetime] | None = None) -> datetime:
     """Return a timezone-aware reference timestamp for relative parsing."""
@@ -68,10 +91,8 @@ def parse_datetime_input(
             minute = int(minute_raw or "0")
             if not (0 <= hour <= 23 and 0 <= minute <= 59):
                 return None
-            day_key = day_token.lower()
-            offset_days = {"heute": 0, "morgen": 1, "uebermorgen": 2, "übermorgen": 2}
             base = resolve_reference_now(now_fn)
-            parsed = (base + timedelta(days=offset_days[day_key])).replace(
+            parsed = (base + timedelta(days=DAY_OFFSETS[day_token.lower()])).replace(
                 hour=hour,
                 minute=minute,
                 second=0,
@@ -123,14 +144,10 @@ def normalize_duration_token(value: object) -> str | None:
         return None
 
     amount = int(match.group(1))
-    unit = match.group(2)
     if amount <= 0:
         return None
-    if unit in {"sek", "sekunde", "sekunden", "s"}:
-        return f"{amount}s"
-    if unit in {"stunde", "stunden", "h"}:
-        return f"{amount}h"
-    return f"{amount}m"
+    suffix = DURATION_UNIT_MAP.get(match.group(2), "m")
+    return f"{amount}{suffix}"
 
 
 def duration_seconds_from_value(value: object, *, default_seconds: int) -> int:
@@ -147,10 +164,6 @@ def duration_seconds_from_value(value: object, *, default_seconds: int) -> int:
         )
         if match:
             amount = int(match.group(1))
-            unit = match.group(2)
-            if unit in {"s", "sek", "sekunde", "sekunden"}:
-                return max(1, amount)
-            if unit in {"h", "stunde", "stunden"}:
-                return max(1, amount) * 3600
-            return max(1, amount) * 60
+            suffix = DURATION_UNIT_MAP.get(match.group(2), "m")
+            return max(1, amount) * _UNIT_SECONDS[suffix]
     return default_seconds
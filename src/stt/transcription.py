@@ -77,6 +77,30 @@ class FasterWhisperSTT:
         except Exception as e:
             raise STTError(f"Failed to load model: {e}") from e
 
+    def warm_up(self, duration_seconds: float = 0.5, sample_rate_hz: int = 16000) -> None:
+        """Run one throwaway transcription so the first real utterance skips backend init.
+
+        Args:
+            duration_seconds: Length of the silent warm-up clip
+            sample_rate_hz: Sample rate of the warm-up clip
+        """
+        silence = np.zeros(int(duration_seconds * sample_rate_hz), dtype=np.float32)
+        try:
+            # VAD would drop pure silence before the decoder ever runs.
+            segments, _ = self._model.transcribe(
+                silence,
+                language=self._language,
+                beam_size=self._beam_size,
+                vad_filter=False,
+                without_timestamps=True,
+            )
+            for _ in segments:
+                pass
+        except Exception as e:
+            self._logger.warning("STT warm-up failed: %s", e)
+            return
+        self._logger.debug("STT warm-up finished")
+
     @staticmethod
     def _resolve_download_root(download_root: str | None) -> Path:
         root = (
@@ -74,6 +74,21 @@ class ParseAppConfigBytesTests(unittest.TestCase):
         self.assertEqual((2,), config.tts.cpu_cores)
         self.assertEqual((3, 4, 5), config.llm.cpu_cores)
 
+    def test_stt_compute_type_defaults_follow_device(self) -> None:
+        def parse_stt(stt_section: str):
+            toml = _minimal_toml_bytes() + textwrap.dedent(stt_section).encode("utf-8")
+            return parse_app_config(toml, base_dir=self._base_dir(), source_file="t.toml").stt
+
+        self.assertEqual("int8", parse_stt("").compute_type)
+        self.assertEqual(
+            "int8_float16",
+            parse_stt('\n[stt]\ndevice = "cuda"\n').compute_type,
+        )
+        self.assertEqual(
+            "float16",
+            parse_stt('\n[stt]\ndevice = "cuda"\ncompute_type = "float16"\n').compute_type,
+        )
+
 
 class LoadAppConfigOSErrorTests(unittest.TestCase):
     """Tests for the OSError handling path in load_app_config."""
@@ -1,5 +1,6 @@
 import logging
 import sys
+import tempfile
 import types
 import unittest
 from pathlib import Path
@@ -28,7 +29,7 @@ if "huggingface_hub.utils" not in sys.modules:
     _hf_utils_module.RepositoryNotFoundError = RuntimeError
     sys.modules["huggingface_hub.utils"] = _hf_utils_module
 
-from llm.config import ConfigurationError
+from llm.config import ConfigurationError, LLMConfig
 from llm.factory import create_llm_config
 
 
@@ -93,5 +94,31 @@ class LLMFactoryTests(unittest.TestCase):
         self.assertIn("invalid llm config", str(error.exception))
 
 
+class LLMConfigModelPathTests(unittest.TestCase):
+    def _resolve_local(self, filename: str, logger: logging.Logger) -> str:
+        with tempfile.TemporaryDirectory() as model_dir:
+            (Path(model_dir) / filename).write_bytes(b"GGUF")
+            return LLMConfig._resolve_model_path_from_values(
+                model_dir=model_dir,
+                filename=filename,
+                repo_id=None,
+                revision=None,
+                hf_token=None,
+                logger=logger,
+            )
+
+    def test_unquantized_gguf_logs_warning(self) -> None:
+        logger = logging.getLogger("test.llm.config")
+        with self.assertLogs(logger, level="WARNING") as logs:
+            self._resolve_local("model-f16.gguf", logger)
+
+        self.assertIn("unquantized", logs.output[0])
+
+    def test_quantized_gguf_does_not_warn(self) -> None:
+        logger = logging.getLogger("test.llm.config")
+        with self.assertNoLogs(logger, level="WARNING"):
+            self._resolve_local("model-Q4_K_M.gguf", logger)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -13,7 +13,11 @@ if "llm" not in sys.modules:
     sys.modules["llm"] = _pkg
 
 from llm.parser import ResponseParser
-from llm.parser_extractors import extract_datetime_literal
+from llm.parser_extractors import (
+    extract_calendar_title,
+    extract_datetime_literal,
+    extract_focus_topic,
+)
 from llm.parser_rules import detect_action
 
 
@@ -98,10 +102,27 @@ class ParserStateAndHelpersTests(unittest.TestCase):
         )
         self.assertEqual("2026-02-22T09:00+00:00", parsed)
 
+    def test_quoted_focus_topic_and_title_use_first_quoted_span(self) -> None:
+        self.assertEqual(
+            "Steuern",
+            extract_focus_topic("Starte Pomodoro „Steuern“ und dann 'Mails'"),
+        )
+        self.assertEqual(
+            "Review",
+            extract_calendar_title('Termin mit Titel "Review" morgen um 9 uhr'),
+        )
+
+    def test_quoted_span_does_not_cross_line_breaks(self) -> None:
+        self.assertEqual("b", extract_focus_topic("'a\n'b'"))
+        self.assertIsNone(extract_focus_topic("''"))
+
     def test_detect_action_prefers_last_match(self) -> None:
         action = detect_action("Starte den Timer und stop ihn dann.")
         self.assertEqual("stop", action)
 
+    def test_detect_action_same_position_tie_prefers_later_pattern(self) -> None:
+        self.assertEqual("stop", detect_action("Bitte stopp kurz den Timer"))
+
 
 if __name__ == "__main__":
     unittest.main()
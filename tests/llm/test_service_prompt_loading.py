@@ -14,6 +14,7 @@ if "llm" not in sys.modules:
 
 from llm.config import LLMConfig
 from llm.service import PomodoroAssistantLLM
+from llm.types import EnvironmentContext
 
 
 class _BackendStub:
@@ -71,6 +72,35 @@ class ServicePromptLoadingTests(unittest.TestCase):
 
             self.assertEqual("PROMPT_FROM_BUNDLE", service._system_prompt_template)
 
+    def test_render_substitutes_placeholders_and_tracks_template_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            prompt_path = root / "prompt.md"
+            prompt_path.write_text(
+                "Zeit {current_time} | Licht {ambient_light} | {unknown}",
+                encoding="utf-8",
+            )
+            config = _build_config(root, system_prompt_path=str(prompt_path))
+
+            with patch("llm.service.LlamaBackend", _BackendStub):
+                service = PomodoroAssistantLLM(config)
+
+            env = EnvironmentContext(
+                now_local="2026-02-21T10:05:00+00:00",
+                light_level_lux=120.0,
+            )
+            self.assertEqual(
+                "Zeit 10:05 | Licht 120 lux | {unknown}",
+                service._render_system_message(env),
+            )
+            self.assertEqual(
+                "Zeit Unbekannte Zeit | Licht Keine Daten | {unknown}",
+                service._render_system_message(None),
+            )
+
+            service._system_prompt_template = "Licht {ambient_light}"
+            self.assertEqual("Licht 120 lux", service._render_system_message(env))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import logging
 import sys
+import tempfile
 import types
 import unittest
 from pathlib import Path
@@ -32,8 +33,12 @@ if "huggingface_hub.utils" not in sys.modules:
     sys.modules["huggingface_hub.utils"] = _hf_utils_module
 
 from contracts import StartupError
-from llm.config import ConfigurationError
-from runtime.workers.llm import AffinityConfigError, create_llm_worker
+from llm.config import ConfigurationError, LLMConfig
+from runtime.workers.llm import (
+    AffinityConfigError,
+    _resolve_worker_config,
+    create_llm_worker,
+)
 
 
 def _llm_settings(**overrides):
@@ -150,5 +155,38 @@ class LLMWorkerFactoryTests(unittest.TestCase):
         self.assertTrue(str(error.exception).startswith("LLM configuration error:"))
 
 
+class SharedAffinityThreadCapTests(unittest.TestCase):
+    def setUp(self) -> None:
+        model_file = tempfile.NamedTemporaryFile(suffix=".gguf")
+        self.addCleanup(model_file.close)
+        self.config = LLMConfig(model_path=model_file.name, n_threads=8, n_threads_batch=8)
+
+    def _resolve_with_psutil(self, physical_cores, logical_cores):
+        psutil_stub = types.ModuleType("psutil")
+        psutil_stub.cpu_count = lambda logical=True: logical_cores if logical else physical_cores
+        with patch.dict(sys.modules, {"psutil": psutil_stub}), patch(
+            "runtime.workers.llm.os.cpu_count", return_value=logical_cores
+        ):
+            return _resolve_worker_config(
+                self.config,
+                cpu_cores=(),
+                cpu_affinity_mode="shared",
+                shared_cpu_reserve_cores=1,
+                logger=MagicMock(),
+            )
+
+    def test_shared_mode_caps_threads_at_physical_cores(self) -> None:
+        worker_config = self._resolve_with_psutil(physical_cores=4, logical_cores=8)
+
+        self.assertEqual(3, worker_config.llm_config.n_threads)
+        self.assertEqual(3, worker_config.llm_config.n_threads_batch)
+
+    def test_shared_mode_falls_back_to_logical_count_when_physical_unknown(self) -> None:
+        worker_config = self._resolve_with_psutil(physical_cores=None, logical_cores=6)
+
+        self.assertEqual(5, worker_config.llm_config.n_threads)
+        self.assertEqual(5, worker_config.llm_config.n_threads_batch)
+
+
 if __name__ == "__main__":
     unittest.main()
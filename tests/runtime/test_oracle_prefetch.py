@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import concurrent.futures
+import datetime as dt
+import importlib.util
+import logging
+import sys
+import types
+import unittest
+from pathlib import Path
+from queue import Queue
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Import runtime.engine without executing src/runtime/__init__.py.
+_RUNTIME_DIR = Path(__file__).resolve().parents[2] / "src" / "runtime"
+if "runtime" not in sys.modules:
+    _pkg = types.ModuleType("runtime")
+    _pkg.__path__ = [str(_RUNTIME_DIR)]  # type: ignore[attr-defined]
+    sys.modules["runtime"] = _pkg
+
+
+def _build_third_party_stub_modules():
+    """Stub native model/audio dependencies that are not installed in CI."""
+    attributes = {
+        "numpy": {"ndarray": object},
+        "piper": {},
+        "piper.voice": {"PiperVoice": object},
+        "pvporcupine": {},
+        "pvrecorder": {"PvRecorder": object},
+        "huggingface_hub": {"hf_hub_download": lambda *args, **kwargs: None},
+        "huggingface_hub.utils": {
+            "HfHubHTTPError": RuntimeError,
+            "RepositoryNotFoundError": RuntimeError,
+        },
+    }
+    stubs: dict[str, types.ModuleType] = {}
+    for name, values in attributes.items():
+        root = name.split(".")[0]
+        if root in sys.modules or importlib.util.find_spec(root) is not None:
+            continue
+        module = types.ModuleType(name)
+        module.__dict__.update(values)
+        stubs[name] = module
+    return stubs
+
+
+with patch.dict(sys.modules, _build_third_party_stub_modules()):
+    from runtime import engine as engine_module
+    from runtime.components import RuntimeComponents
+    from stt.events import Utterance, WakeWordDetectedEvent
+
+
+class _FailingOracleStub:
+    def __init__(self, calls: list[str]) -> None:
+        self._calls = calls
+
+    def build_environment_payload(self) -> dict[str, object]:
+        self._calls.append("oracle")
+        raise RuntimeError("calendar unavailable")
+
+
+class OraclePrefetchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls: list[str] = []
+        self.logger = MagicMock(spec=logging.Logger)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(self.executor.shutdown, wait=True)
+        components = RuntimeComponents(
+            ui=MagicMock(),
+            pomodoro_timer=MagicMock(),
+            countdown_timer=MagicMock(),
+            dispatcher=MagicMock(),
+            event_queue=Queue(),
+            publisher=MagicMock(),
+            utterance_executor=self.executor,
+        )
+        self.engine = engine_module.RuntimeEngine(
+            logger=self.logger,
+            app_config=SimpleNamespace(llm=SimpleNamespace(fast_path_enabled=False)),
+            wake_word_config=MagicMock(),
+            stt=MagicMock(),
+            oracle_service=_FailingOracleStub(self.calls),
+            components=components,
+        )
+
+    def test_failed_prefetch_is_logged_and_next_utterance_still_runs(self) -> None:
+        now = dt.datetime(2026, 3, 2, 9, 0, tzinfo=dt.timezone.utc)
+
+        def process_utterance_stub(utterance, **kwargs):
+            self.calls.append("utterance")
+
+        self.engine._on_wake_word_detected(WakeWordDetectedEvent(occurred_at=now))
+        with patch.object(engine_module, "process_utterance", process_utterance_stub):
+            self.engine._submit_utterance(
+                Utterance(audio_bytes=b"\x00\x00", sample_rate_hz=16000, created_at=now),
+                duration_seconds=0.0,
+                audio_bytes=2,
+            )
+            self.engine._pending_utterance.result(timeout=5.0)
+
+        self.assertEqual(["oracle", "utterance"], self.calls)
+        self.logger.warning.assert_called_once()
+        self.assertIn("prefetch", self.logger.warning.call_args.args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
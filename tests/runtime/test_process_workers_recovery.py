@@ -127,6 +127,27 @@ class ProcessWorkerRecoveryTests(unittest.TestCase):
         with self.assertRaises(WorkerClosedError):
             worker.call("payload")
 
+    def test_initial_startup_timeout_does_not_stretch_restarts(self) -> None:
+        with patch.object(_ProcessWorker, "_start_worker", return_value=None) as start_worker:
+            worker = _ProcessWorker(
+                name="test-worker",
+                runtime_factory=_dummy_runtime_factory,
+                runtime_args=(),
+                cpu_cores=(),
+                log_queue=None,
+                log_level=logging.INFO,
+                logger=logging.getLogger("test"),
+                startup_timeout_seconds=5.0,
+                initial_startup_timeout_seconds=60.0,
+            )
+            with patch.object(worker, "_shutdown_worker"):
+                worker._restart_worker(reason="test restart")
+
+        self.assertEqual(
+            [60.0, 5.0],
+            [call.kwargs["timeout_seconds"] for call in start_worker.call_args_list],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
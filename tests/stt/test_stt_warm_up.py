@@ -0,0 +1,89 @@
+import importlib.util
+import logging
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+_SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+if str(_SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(_SRC_DIR))
+
+# Import stt.transcription without executing src/stt/__init__.py.
+_STT_DIR = Path(__file__).resolve().parents[2] / "src" / "stt"
+if "stt" not in sys.modules:
+    _pkg = types.ModuleType("stt")
+    _pkg.__path__ = [str(_STT_DIR)]  # type: ignore[attr-defined]
+    sys.modules["stt"] = _pkg
+
+
+def _build_numpy_stub_modules() -> dict[str, types.ModuleType]:
+    if "numpy" in sys.modules or importlib.util.find_spec("numpy") is not None:
+        return {}
+    numpy_stub = types.ModuleType("numpy")
+    numpy_stub.__dict__.update(
+        {
+            "ndarray": object,
+            "float32": float,
+            "zeros": lambda size, dtype=float: [dtype(0)] * size,
+        }
+    )
+    return {"numpy": numpy_stub}
+
+
+with patch.dict(sys.modules, _build_numpy_stub_modules()):
+    from stt import transcription as transcription_module
+
+
+class _WhisperModelStub:
+    def __init__(self, *args, **kwargs) -> None:
+        self.transcribe_calls: list[tuple[object, dict[str, object]]] = []
+        self.error: Exception | None = None
+
+    def transcribe(self, audio, **kwargs):
+        self.transcribe_calls.append((audio, kwargs))
+        if self.error is not None:
+            raise self.error
+        return iter([]), None
+
+
+class FasterWhisperWarmUpTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.logger = MagicMock(spec=logging.Logger)
+        faster_whisper_stub = types.ModuleType("faster_whisper")
+        faster_whisper_stub.WhisperModel = _WhisperModelStub  # type: ignore[attr-defined]
+        with patch.dict(sys.modules, {"faster_whisper": faster_whisper_stub}):
+            self.stt = transcription_module.FasterWhisperSTT(
+                language="de",
+                beam_size=3,
+                download_root=self._tmp.name,
+                logger=self.logger,
+            )
+        self.model = self.stt._model
+
+    def test_warm_up_runs_one_transcription_without_vad(self) -> None:
+        self.stt.warm_up(duration_seconds=0.5, sample_rate_hz=16000)
+
+        self.assertEqual(1, len(self.model.transcribe_calls))
+        audio, kwargs = self.model.transcribe_calls[0]
+        self.assertEqual(8000, len(audio))
+        self.assertFalse(kwargs["vad_filter"])
+        self.assertEqual("de", kwargs["language"])
+        self.assertEqual(3, kwargs["beam_size"])
+
+    def test_warm_up_failure_is_logged_not_raised(self) -> None:
+        self.model.error = RuntimeError("cuda kernel missing")
+
+        self.stt.warm_up()
+
+        self.assertEqual(1, len(self.model.transcribe_calls))
+        self.logger.warning.assert_called_once()
+        self.assertIn("warm-up", self.logger.warning.call_args.args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
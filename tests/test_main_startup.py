@@ -1,9 +1,12 @@
 import sys
+import threading
 import unittest
 import types
 import importlib
+import importlib.util
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 _SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 if str(_SRC_DIR) not in sys.path:
@@ -43,6 +46,41 @@ def _import_main_with_startup_stubs():
         return importlib.import_module("main")
 
 
+_OPTIONAL_SUBSYSTEM_PACKAGES = ("oracle", "server", "websockets")
+_RELOADED_PACKAGES = ("main", "runtime", "stt", "tts", "llm", *_OPTIONAL_SUBSYSTEM_PACKAGES)
+
+
+def _third_party_stubs() -> dict[str, types.ModuleType]:
+    """Stub native model/audio dependencies that are not installed in CI."""
+    attributes = {
+        "numpy": {"ndarray": object},
+        "piper": {},
+        "piper.voice": {"PiperVoice": object},
+        "pvporcupine": {},
+        "pvrecorder": {"PvRecorder": object},
+        "huggingface_hub": {"hf_hub_download": lambda *args, **kwargs: None},
+        "huggingface_hub.utils": {
+            "HfHubHTTPError": RuntimeError,
+            "RepositoryNotFoundError": RuntimeError,
+        },
+    }
+    stubs: dict[str, types.ModuleType] = {}
+    for name, values in attributes.items():
+        root = name.split(".")[0]
+        if root in sys.modules or importlib.util.find_spec(root) is not None:
+            continue
+        module = types.ModuleType(name)
+        module.__dict__.update(values)
+        stubs[name] = module
+    return stubs
+
+
+def _is_loaded(package: str) -> bool:
+    return any(
+        name == package or name.startswith(f"{package}.") for name in sys.modules
+    )
+
+
 class _CrashDuringStartupService:
     def __init__(self):
         self.is_running = True
@@ -83,7 +121,7 @@ class MainStartupTests(unittest.TestCase):
         with patch.object(
             app_main.time,
             "monotonic",
-            side_effect=[0.0, 0.0, 0.0, 0.2, 0.2, 0.6],
+            side_effect=[0.0, 0.0, 0.2, 0.6],
         ):
             result = app_main._wait_for_service_ready_callback(service, timeout=0.5)
 
@@ -91,5 +129,162 @@ class MainStartupTests(unittest.TestCase):
         self.assertEqual([0.25, 0.25], service.wait_calls)
 
 
+class _WorkerClientStub:
+    def __init__(self) -> None:
+        self.close_calls = 0
+        self.closed = threading.Event()
+
+    def close(self) -> None:
+        self.close_calls += 1
+        self.closed.set()
+
+
+class MainWorkerCleanupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app_main = _import_main_with_startup_stubs()
+        self.stt_client = _WorkerClientStub()
+        self.llm_client = _WorkerClientStub()
+        app_config = SimpleNamespace(
+            wake_word=None,
+            stt=None,
+            tts=None,
+            llm=None,
+            oracle=None,
+            ui_server=SimpleNamespace(enabled=False),
+        )
+        secret_config = SimpleNamespace(
+            pico_voice_access_key="key",
+            hf_token=None,
+            oracle_google_calendar_id=None,
+            oracle_google_service_account_file=None,
+        )
+        self._patches = [
+            patch.object(
+                self.app_main,
+                "_start_log_listener",
+                return_value=(MagicMock(), MagicMock()),
+            ),
+            patch.object(
+                self.app_main,
+                "_load_runtime_config",
+                return_value=(app_config, secret_config),
+            ),
+        ]
+        for active_patch in self._patches:
+            active_patch.start()
+            self.addCleanup(active_patch.stop)
+
+    def _factories(
+        self,
+        *,
+        stt_error: BaseException | None = None,
+        tts_error: BaseException | None = None,
+        llm_release: threading.Event | None = None,
+    ):
+        def create_stt_worker(**kwargs):
+            if stt_error is not None:
+                raise stt_error
+            return object(), self.stt_client
+
+        def create_llm_worker(**kwargs):
+            if llm_release is not None:
+                llm_release.wait(timeout=5.0)
+            return self.llm_client
+
+        def create_tts_worker(**kwargs):
+            if tts_error is not None:
+                raise tts_error
+            return None
+
+        return (
+            create_stt_worker,
+            create_llm_worker,
+            create_tts_worker,
+        )
+
+    def test_partial_startup_failure_closes_started_workers(self) -> None:
+        factories = self._factories(
+            tts_error=self.app_main.StartupError("TTS failed"),
+        )
+        with patch.object(self.app_main, "_load_worker_factories", return_value=factories):
+            result = self.app_main.main()
+
+        self.assertEqual(1, result)
+        # Startups still in flight when the failure surfaces close from their
+        # pool threads.
+        self.assertTrue(self.stt_client.closed.wait(timeout=5.0))
+        self.assertTrue(self.llm_client.closed.wait(timeout=5.0))
+        self.assertEqual(1, self.stt_client.close_calls)
+        self.assertEqual(1, self.llm_client.close_calls)
+
+    def test_interrupt_after_startup_closes_started_workers(self) -> None:
+        def interrupted_engine(**kwargs):
+            raise KeyboardInterrupt
+
+        with patch.object(
+            self.app_main, "_load_worker_factories", return_value=self._factories()
+        ), patch.object(
+            self.app_main, "_load_oracle_factory", return_value=lambda **kwargs: None
+        ), patch.object(
+            self.app_main, "_load_runtime_engine", return_value=interrupted_engine
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                self.app_main.main()
+
+        self.assertEqual(1, self.stt_client.close_calls)
+        self.assertEqual(1, self.llm_client.close_calls)
+
+    def test_fast_startup_failure_is_reported_before_slow_loads_finish(self) -> None:
+        llm_release = threading.Event()
+        factories = self._factories(
+            stt_error=self.app_main.StartupError("Picovoice key rejected"),
+            llm_release=llm_release,
+        )
+        with patch.object(self.app_main, "_load_worker_factories", return_value=factories):
+            result = self.app_main.main()
+
+        self.assertEqual(1, result)
+        self.assertFalse(llm_release.is_set())
+        self.assertEqual(0, self.llm_client.close_calls)
+        llm_release.set()
+
+        self.assertTrue(self.llm_client.closed.wait(timeout=5.0))
+
+    def test_interrupt_during_startup_closes_workers_that_finish_later(self) -> None:
+        llm_release = threading.Event()
+        factories = self._factories(llm_release=llm_release)
+
+        with patch.object(
+            self.app_main, "_load_worker_factories", return_value=factories
+        ), patch.object(
+            self.app_main.concurrent.futures,
+            "wait",
+            side_effect=KeyboardInterrupt,
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                self.app_main.main()
+
+        self.assertEqual(0, self.llm_client.close_calls)
+        llm_release.set()
+
+        self.assertTrue(self.llm_client.closed.wait(timeout=5.0))
+        self.assertTrue(self.stt_client.closed.wait(timeout=5.0))
+
+
+class MainStartupImportTests(unittest.TestCase):
+    def test_startup_imports_skip_oracle_and_ui_server_packages(self) -> None:
+        with patch.dict(sys.modules, _third_party_stubs()):
+            for name in list(sys.modules):
+                if name.split(".")[0] in _RELOADED_PACKAGES:
+                    del sys.modules[name]
+
+            app_main = importlib.import_module("main")
+            app_main._load_worker_factories()
+            app_main._load_runtime_engine()
+
+            for package in _OPTIONAL_SUBSYSTEM_PACKAGES:
+                self.assertFalse(_is_loaded(package), package)
+
+
 if __name__ == "__main__":
     unittest.main()